@@ -0,0 +1,1114 @@
+"""TÜRSAB bot benchmark'ları
+
+Kullanım:
+    python3 benchmark.py save --rows 20000
+    python3 benchmark.py parse --iterations 200 [--browser]
+    python3 benchmark.py search --searches 500 [--browser]
+    python3 benchmark.py scan --codes 2000 --workers 1 4 8 --rate 0
+    python3 benchmark.py plan [--hit-map scan_state.tsv] [--history 0.8]
+    python3 benchmark.py export --rows 1000000 --formats csv parquet xlsx
+    python3 benchmark.py query --rows 500000
+    python3 benchmark.py pool --threads 8 --ops 500
+    python3 benchmark.py driver --instances 2 --searches 50
+    python3 benchmark.py browser --searches 50
+    python3 benchmark.py replay [--fixtures fixtures/recorded] [--baseline replay_baseline.json] [--browser]
+    python3 benchmark.py records --rows 100000
+    python3 benchmark.py dedup --rows 100000 --new-rows 1000
+    python3 benchmark.py startup --repeats 5
+"""
+import argparse
+import collections
+import contextlib
+import io
+import json
+import os
+import pathlib
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+from sqlalchemy import create_engine, text
+
+from mock_server import MockTursabServer, ReplayTursabServer
+from tursab_bot import (
+    AGENCY_FIELDS, Agency, AgencyRecord, CircuitBreaker, DatabaseManager, DriverPool, DuplicateIndex, FixtureRecorder, HttpSearchBackend, PacingPolicy,
+    RetryPolicy, RetryRule, ScanPlanner, ScanScheduler, ScanStateStore, agency_blocking_keys, agency_content_hash, dispose_engines, export_agencies, fold_name,
+    build_place_lookup, launch_chrome, load_fixtures, normalize_frame, normalize_record, normalize_records,
+    parse_agency_container_html, parse_result_page, prepare_records, process_tree_rss_mb,
+    resolve_chromedriver_path,
+)
+
+FIXTURES_DIR = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+
+def make_agencies(count, start=1000):
+    """Sentetik acenta verisi üret"""
+    agencies = []
+    for i in range(start, start + count):
+        agencies.append({
+            'belge_no': str(i),
+            'acenta_adi': f"ÖRNEK {i} TURİZM SEYAHAT ACENTASI",
+            'telefon': f"+90 212 {i % 1000:03d} {i % 100:02d} {i % 97:02d}",
+            'faks': f"+90 212 {i % 1000:03d} {i % 100:02d} 00",
+            'email': f"info{i}@ornek.com",
+            'adres': f"ÖRNEK MAH. ÖRNEK CAD. NO:{i} ŞİŞLİ / İSTANBUL",
+            'ilce': "ŞİŞLİ",
+            'sehir': "İSTANBUL",
+            'btk': "İSTANBUL",
+        })
+    return agencies
+
+
+def _timed(func, *args, **kwargs):
+    """Fonksiyonu stdout'u susturarak çalıştır ve süreyi döndür"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def bench_save(rows, batch_size):
+    """save_agencies: satır satır yol ile toplu upsert karşılaştırması"""
+    agencies = make_agencies(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, kwargs in (("per-row", {}), ("bulk", {'bulk': True, 'batch_size': batch_size})):
+            db_path = os.path.join(tmp, f"{label}.db")
+            with contextlib.redirect_stdout(io.StringIO()):
+                db = DatabaseManager(f"sqlite:///{db_path}")
+
+            # İlk yükleme (insert) ve tekrar yükleme (update)
+            _, insert_time = _timed(db.save_agencies, agencies, **kwargs)
+            _, update_time = _timed(db.save_agencies, agencies, **kwargs)
+            db.engine.dispose()
+
+            print(f"{label:>8}: insert {rows / insert_time:10.0f} rows/s, "
+                  f"update {rows / update_time:10.0f} rows/s")
+
+
+def _report_latency(label, samples):
+    """Gecikme örneklerini ms cinsinden yazdır"""
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1] if len(samples) >= 20 else samples[-1]
+    print(f"{label:>24}: median {statistics.median(samples) * 1000:8.2f} ms, "
+          f"p95 {p95 * 1000:8.2f} ms")
+
+
+def bench_parse(iterations, browser):
+    """Sayfa başına parse gecikmesi: page_source + BeautifulSoup yolu ile element bazlı yol"""
+    fixtures = sorted(FIXTURES_DIR.glob("result_*.html"))
+
+    for fixture in fixtures:
+        html = fixture.read_text(encoding="utf-8")
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            parse_result_page(html)
+            samples.append(time.perf_counter() - start)
+        _report_latency(f"html {fixture.stem}", samples)
+
+    if not browser:
+        return
+
+    # Eski yol gerçek bir Chrome ister; fixture dosyası file:// ile açılır
+    from tursab_bot import TursabBot
+
+    bot = TursabBot()
+    try:
+        for fixture in fixtures:
+            bot.driver.get(fixture.as_uri())
+            for parser in ('selenium', 'html'):
+                bot.parser = parser
+                samples = []
+                for _ in range(iterations):
+                    _, elapsed = _timed(bot.extract_agency_data)
+                    samples.append(elapsed)
+                _report_latency(f"{parser} {fixture.stem}", samples)
+    finally:
+        bot.close()
+
+
+def _rss_mb(pid="self"):
+    """Linux'ta /proc üzerinden RSS (MB)"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _format_mb(value):
+    return f"{value:7.1f} MB" if value is not None else "    n/a"
+
+
+def bench_search(searches, hit_ratio, browser):
+    """Yerel sunucuya karşı searches/sec ve worker başına bellek: HTTP ile Chrome"""
+    agencies = make_agencies(int(searches * hit_ratio))
+    hits = {agency['belge_no']: [agency] for agency in agencies}
+    codes = [str(code) for code in range(1000, 1000 + searches)]
+
+    with MockTursabServer(hits=hits) as server:
+        rss_before = _rss_mb()
+        backend = HttpSearchBackend(search_url=server.url)
+        backend.open_site()
+        start = time.perf_counter()
+        for code in codes:
+            backend.search(code)
+        elapsed = time.perf_counter() - start
+        rss_after = _rss_mb()
+        backend.close()
+        worker_rss = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        print(f"    http: {searches / elapsed:8.1f} searches/s, worker RSS +{_format_mb(worker_rss)} "
+              f"(süreç toplam {_format_mb(rss_after)})")
+
+        if not browser:
+            return
+
+        from tursab_bot import TursabBot
+
+        bot = TursabBot(search_url=server.url)
+        try:
+            bot.open_site()
+            browser_searches = min(searches, 50)
+            start = time.perf_counter()
+            for code in codes[:browser_searches]:
+                _timed(bot.search_agency, code)
+                _timed(bot.extract_agency_data)
+            elapsed = time.perf_counter() - start
+            chrome_rss = process_tree_rss_mb(bot.driver.service.process.pid)
+            print(f"selenium: {browser_searches / elapsed:8.1f} searches/s, "
+                  f"Chrome RSS {_format_mb(chrome_rss)}")
+        finally:
+            bot.close()
+
+
+def bench_scan(codes, workers_list, rate, hit_ratio, latency, flaky_ratio=0.0):
+    """ScanScheduler'ı yerel sunucuya karşı uçtan uca çalıştır
+
+    flaky_ratio oranındaki kodlar her worker sayısı için ilk denemede "Hata" paneli döndürür.
+    """
+    code_range = range(1000, 1000 + codes)
+    step = max(int(1 / hit_ratio), 1) if hit_ratio else codes + 1
+    hits = {agency['belge_no']: [agency] for agency in make_agencies(codes) if int(agency['belge_no']) % step == 0}
+    rng = random.Random(18)
+    flaky = [str(code) for code in code_range if rng.random() < flaky_ratio]
+    # Tekrar denemeler beklemeden yapılsın, ölçülen şey hız ve kayıp
+    retry_policy = RetryPolicy({'site_error': RetryRule(0.0, 0.0, 4, 'reload')})
+
+    with MockTursabServer(hits=hits, latency=latency) as server, tempfile.TemporaryDirectory() as tmp:
+        for workers in workers_list:
+            server.flaky_codes = dict.fromkeys(flaky, 1)
+            state_store = ScanStateStore(os.path.join(tmp, f"state_{workers}.tsv"))
+            scheduler = ScanScheduler(
+                lambda: HttpSearchBackend(search_url=server.url),
+                code_range,
+                workers=workers,
+                chunk_size=50,
+                rate=rate,
+                state_store=state_store,
+                retry_policy=retry_policy,
+                breaker=CircuitBreaker(threshold=0),
+            )
+            stats, elapsed = _timed(scheduler.run)
+            state_store.close()
+
+            covered = len(state_store.states) == codes
+            print(f"{workers:>3} worker: {stats.total / elapsed:8.1f} arama/s, "
+                  f"found {stats.successful}/{len(hits)}, error {stats.counts['error']}, "
+                  f"tekrar {sum(stats.retries.values())}/{len(flaky)}, "
+                  f"tüm kodlar kayıtlı: {'evet' if covered else 'hayır'}")
+
+
+def synthetic_hit_map(start=1000, end=100000, seed=42):
+    """Kümelenmiş sentetik isabet haritası: yoğun bir başlangıç bölgesi + dağınık kümeler"""
+    rng = random.Random(seed)
+    hits = {code for code in range(start, min(start + 14000, end)) if rng.random() < 0.6}
+    for _ in range(40):
+        cluster_start = rng.randrange(start + 14000, end)
+        cluster_size = rng.randint(20, 80)
+        hits.update(code for code in range(cluster_start, min(cluster_start + cluster_size, end))
+                    if rng.random() < 0.4)
+    hits.update(rng.randrange(start, end) for _ in range(200))
+    return hits
+
+
+def simulate_coverage(hits, codes, planner=None, chunk_size=50):
+    """Planı kayıtlı isabet haritasına karşı oynat, her isabetteki istek sayısını döndür"""
+    requests_at_hit = []
+    requests = 0
+    if planner is None:
+        chunks = (codes[i:i + chunk_size] for i in range(0, len(codes), chunk_size))
+    else:
+        chunks = iter(lambda: planner.next_chunk(chunk_size), [])
+    for chunk in chunks:
+        for code in chunk:
+            requests += 1
+            status = 'found' if code in hits else 'empty'
+            if status == 'found':
+                requests_at_hit.append(requests)
+            if planner is not None:
+                planner.observe(code, status)
+    return requests_at_hit, requests
+
+
+def bench_plan(hit_map, db_url, start, end, history, block_size, sample_stride):
+    """Sıralı ve adaptif plan için istek sayısı - kapsama eğrisi"""
+    if hit_map:
+        hits = ScanStateStore(hit_map).codes_with_status('found')
+    elif db_url:
+        with contextlib.redirect_stdout(io.StringIO()):
+            hits = DatabaseManager(db_url).get_belge_numbers()
+    else:
+        hits = synthetic_hit_map(start, end)
+
+    codes = list(range(start, end))
+    hits = {code for code in hits if start <= code < end}
+    rng = random.Random(0)
+    known = {code for code in hits if rng.random() < history}
+
+    scenarios = [
+        ("sıralı", None),
+        ("adaptif (geçmiş yok)", ScanPlanner(codes, block_size=block_size, sample_stride=sample_stride)),
+        (f"adaptif (%{history * 100:.0f} bilinen)", ScanPlanner(codes, hits=known, block_size=block_size,
+                                                               sample_stride=sample_stride)),
+    ]
+    targets = (0.5, 0.8, 0.9, 0.95, 0.99, 1.0)
+
+    print(f"{len(hits)} isabet, {len(codes)} kod")
+    print(f"{'plan':>24} | " + " | ".join(f"%{t * 100:>3.0f}" for t in targets))
+    for label, planner in scenarios:
+        requests_at_hit, _ = simulate_coverage(hits, codes, planner)
+        cells = []
+        for target in targets:
+            needed = max(int(len(requests_at_hit) * target + 0.999999) - 1, 0)
+            cells.append(f"{requests_at_hit[needed]:>6}" if requests_at_hit else "     -")
+        print(f"{label:>24} | " + " | ".join(cells))
+
+
+class PeakRssSampler:
+    """Arka planda RSS örnekleyip tepe değeri tutar"""
+
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _rss_mb() or 0.0)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.baseline = _rss_mb() or 0.0
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_mb() or 0.0)
+
+
+CITIES = {
+    "İSTANBUL": ["ŞİŞLİ", "BEYOĞLU", "KADIKÖY", "FATİH", "BEŞİKTAŞ", "ÜSKÜDAR"],
+    "ANTALYA": ["MURATPAŞA", "KONYAALTI", "ALANYA", "MANAVGAT", "KEMER"],
+    "İZMİR": ["KONAK", "KARŞIYAKA", "ÇEŞME", "BORNOVA"],
+    "ANKARA": ["ÇANKAYA", "KEÇİÖREN", "YENİMAHALLE"],
+    "MUĞLA": ["BODRUM", "FETHİYE", "MARMARİS", "DALAMAN"],
+    "NEVŞEHİR": ["ÜRGÜP", "GÖREME", "AVANOS"],
+}
+# Gerçek dağılıma benzer şekilde acentaların çoğu birkaç şehirde toplanır
+CITY_WEIGHTS = [50, 25, 12, 8, 4, 1]
+NAME_WORDS = ["IŞIK", "ÇAĞLAR", "GÜNEŞ", "DENİZ", "ÖZTÜRK", "YILDIZ", "ŞAHİN", "ATLAS", "MAVİ", "EGE",
+              "ANADOLU", "KAPADOKYA", "LİKYA", "İPEK", "YOL", "DOĞA", "KARTAL", "ÇINAR", "AKDENİZ", "PAMUK"]
+
+
+def make_directory_agencies(count, start=1000, seed=7):
+    """Şehir/ilçe/BTK ve ad dağılımı çeşitli sentetik acenta verisi üret"""
+    rng = random.Random(seed + start)
+    cities = list(CITIES)
+    agencies = make_agencies(count, start=start)
+    for agency in agencies:
+        sehir, btk = rng.choices(cities, weights=CITY_WEIGHTS, k=2)
+        agency.update(
+            acenta_adi=f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)} TURİZM {agency['belge_no']}",
+            sehir=sehir, ilce=rng.choice(CITIES[sehir]), btk=btk,
+        )
+    return agencies
+
+
+def populate_agencies(db, rows, batch=50000, factory=make_agencies):
+    """agencies tablosunu Core executemany ile hızlıca doldur"""
+    table = Agency.__table__
+    with db.engine.begin() as conn:
+        for start in range(1000, 1000 + rows, batch):
+            chunk = factory(min(batch, 1000 + rows - start), start=start)
+            for agency in chunk:
+                agency['content_hash'] = agency_content_hash(agency)
+                agency['acenta_adi_norm'] = fold_name(agency['acenta_adi'])
+            conn.execute(table.insert(), chunk)
+
+
+def bench_export(rows, formats, chunk_size):
+    """Akışlı dışa aktarma: süre ve tepe bellek (RSS artışı) satır sayısından bağımsız olmalı"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = DatabaseManager(f"sqlite:///{os.path.join(tmp, 'export.db')}")
+        start = time.perf_counter()
+        populate_agencies(db, rows)
+        print(f"{rows} satır oluşturuldu ({time.perf_counter() - start:.1f}s)")
+
+        if 'parquet' in formats:
+            import pyarrow.parquet  # noqa: F401  kütüphane yükü tepe bellek ölçümüne karışmasın
+        for fmt in formats:
+            path = os.path.join(tmp, f"agencies.{fmt}")
+            with PeakRssSampler() as sampler:
+                start = time.perf_counter()
+                written = export_agencies(db, path, fmt=fmt, chunk_size=chunk_size)
+                elapsed = time.perf_counter() - start
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"{fmt:>8}: {written} satır, {written / elapsed:10.0f} satır/s, dosya {size_mb:7.1f} MB, "
+                  f"tepe RSS +{sampler.peak - sampler.baseline:6.1f} MB")
+        db.engine.dispose()
+
+
+PHONE_FORMATS = ("+90 {a} {b} {c} {d}", "0{a} {b} {c} {d}", "({a}) {b}-{c}{d}", "0{a}{b}{c}{d}", "{a} {b} {c} {d}")
+PLACE_SPELLINGS = (str, str.lower, str.title, lambda value: value.replace('İ', 'I').replace('Ş', 'S'))
+
+
+def make_messy_agencies(count, seed=19):
+    """Farklı telefon biçimleri, büyük/küçük harf e-posta ve şehir/ilçe yazımları içeren acentalar"""
+    rng = random.Random(seed)
+    agencies = make_directory_agencies(count, seed=seed)
+    for agency in agencies:
+        a, b, c, d = rng.choice(("212", "216", "232", "242")), rng.randint(100, 999), rng.randint(10, 99), \
+            rng.randint(10, 99)
+        agency['telefon'] = rng.choice(PHONE_FORMATS).format(a=a, b=b, c=c, d=d)
+        agency['faks'] = rng.choice(PHONE_FORMATS + ("",)).format(a=a, b=b, c=c, d=d)
+        agency['email'] = rng.choice((str, str.upper, str.title))(agency['email']) + rng.choice(("", " "))
+        for field in ('sehir', 'ilce', 'btk'):
+            agency[field] = rng.choice(PLACE_SPELLINGS)(agency[field])
+    return agencies
+
+
+def _allocated_bytes(func):
+    """func'ın döndürdüğü nesnelerin tracemalloc ile ölçülen boyutu"""
+    tracemalloc.start()
+    try:
+        result = func()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def bench_records(rows):
+    """Kayıt başına bellek (dict / AgencyRecord) ve normalizasyon hızı (satır satır / pandas)"""
+    agencies = make_messy_agencies(rows)
+
+    # Alan değerleri (string'ler) iki yapıda da ortak; fark kapsayıcı nesnenin kendisi
+    dicts, dict_bytes = _allocated_bytes(lambda: [dict(agency) for agency in agencies])
+    records, record_bytes = _allocated_bytes(lambda: [AgencyRecord.from_dict(agency) for agency in agencies])
+    print(f"{'dict':>17}: {dict_bytes / rows:6.0f} byte/kayıt")
+    print(f"{'AgencyRecord':>17}: {record_bytes / rows:6.0f} byte/kayıt ({record_bytes / dict_bytes:.0%})")
+    del dicts
+
+    import pandas as pd
+
+    # İlçe tablosu: sentetik şehirlerin doğru yazılmış ilçeleri
+    lookup = build_place_lookup((ilce, 1) for districts in CITIES.values() for ilce in districts)
+    start = time.perf_counter()
+    scalar = [normalize_record(record, lookup) for record in records]
+    scalar_time = time.perf_counter() - start
+
+    frame = pd.DataFrame.from_records([record.as_tuple() for record in records], columns=AGENCY_FIELDS)
+    start = time.perf_counter()
+    normalized = normalize_frame(frame, lookup)
+    frame_time = time.perf_counter() - start
+    from_frame = [AgencyRecord(*row) for row in normalized.itertuples(index=False, name=None)]
+
+    start = time.perf_counter()
+    batched = normalize_records(records, lookup)
+    batched_time = time.perf_counter() - start
+
+    same = batched == scalar and from_frame == scalar
+    print(f"{'normalize_record':>17}: {rows / scalar_time:10.0f} kayıt/s (satır satır)")
+    print(f"{'normalize_records':>17}: {rows / batched_time:10.0f} kayıt/s (tekrar eden değerler önbellekli)")
+    print(f"{'normalize_frame':>17}: {rows / frame_time:10.0f} kayıt/s (pandas sütunları, backfill yolu)")
+    print(f"sonuçlar aynı: {'evet' if same else 'hayır'}")
+
+
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'bs4', 'requests', 'urllib3', 'pandas', 'numpy')
+
+# Her ölçüm ayrı bir yorumlayıcıda çalışır (soğuk import); sonuç stdout'a JSON olarak yazılır
+STARTUP_PROBE = """
+import json, sys, time
+for name in {blocked!r}:
+    sys.modules[name] = None
+start = time.perf_counter()
+import tursab_bot
+imported = time.perf_counter()
+rows = None
+if {db_url!r}:
+    import contextlib, io
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = len(tursab_bot.DatabaseManager({db_url!r}).get_belge_numbers())
+done = time.perf_counter()
+print(json.dumps({{'import': imported - start, 'total': done - start, 'rows': rows,
+                  'loaded': [name for name in {heavy!r} if sys.modules.get(name) is not None]}}))
+"""
+
+
+def _startup_probe(db_url=None, blocked=()):
+    code = STARTUP_PROBE.format(db_url=db_url, blocked=tuple(blocked), heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True,
+                            cwd=pathlib.Path(__file__).resolve().parent).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _wall_time(command):
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, cwd=pathlib.Path(__file__).resolve().parent)
+    return time.perf_counter() - start
+
+
+def bench_startup(repeats):
+    """Modül import süresi, ilk veritabanı sorgusuna kadar soğuk başlangıç ve CLI --help süresi"""
+    with tempfile.TemporaryDirectory() as directory:
+        db_url = f"sqlite:///{directory}/startup.db"
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = DatabaseManager(db_url)
+            db.bulk_upsert_agencies(make_agencies(1000))
+            db.engine.dispose()
+
+        rows = [
+            ("import tursab_bot", {}),
+            ("ilk sorgu", {'db_url': db_url}),
+            ("ilk sorgu, selenium yok", {'db_url': db_url, 'blocked': ('selenium', 'webdriver_manager')}),
+        ]
+        for label, kwargs in rows:
+            probes = [_startup_probe(**kwargs) for _ in range(repeats)]
+            key = 'total' if kwargs else 'import'
+            elapsed = statistics.median(probe[key] for probe in probes)
+            loaded = ', '.join(probes[0]['loaded']) or "yok"
+            result = f", {probes[0]['rows']} kayıt" if probes[0]['rows'] is not None else ""
+            print(f"{label:>24}: {elapsed * 1000:7.1f} ms (medyan, {repeats} tekrar){result}, "
+                  f"yüklenen ağır paketler: {loaded}")
+
+    heavy = "import selenium.webdriver, webdriver_manager.chrome, bs4, requests"
+    eager = statistics.median(_wall_time([sys.executable, '-c', heavy]) for _ in range(repeats))
+    interpreter = statistics.median(_wall_time([sys.executable, '-c', 'pass']) for _ in range(repeats))
+    cli_help = statistics.median(_wall_time([sys.executable, 'tursab_bot.py', '--help']) for _ in range(repeats))
+    print(f"{'boş yorumlayıcı':>24}: {interpreter * 1000:7.1f} ms (süreç)")
+    print(f"{'tursab_bot.py --help':>24}: {cli_help * 1000:7.1f} ms (süreç)")
+    print(f"{'selenium+bs4+requests':>24}: {(eager - interpreter) * 1000:7.1f} ms "
+          f"(eskiden her başlangıçta ödenen import maliyeti)")
+
+
+CONSONANTS = "BCÇDFGHKLMNPRSŞTVYZ"
+VOWELS = "AEIİOÖUÜ"
+DUPLICATE_KINDS = ("branch", "renamed", "typo")
+
+
+def _syllable_word(rng):
+    """Rastgele heceli ad kelimesi (KAR, TÜRE, MELİS gibi)"""
+    syllables = []
+    for _ in range(rng.randint(2, 3)):
+        coda = rng.choice(CONSONANTS) if rng.random() < 0.3 else ""
+        syllables.append(rng.choice(CONSONANTS) + rng.choice(VOWELS) + coda)
+    return ''.join(syllables)
+
+
+def make_duplicate_agencies(count, duplicate_ratio=0.2, seed=23):
+    """Bilinen tekrar kümeleri içeren acentalar: (acenta listesi, belge_no -> gerçek küme) döndürür
+
+    Tekrarlar üç türde üretilir: şube (aynı ad ve alan adı, farklı telefon), yeni ad (aynı telefon,
+    farklı unvan) ve yazım farkı (ad benzer, iletişim bilgileri farklı).
+    """
+    rng = random.Random(seed)
+    agencies, truth = [], {}
+    base = []
+    for i in range(1000, 1000 + count):
+        belge_no = str(i)
+        if base and rng.random() < duplicate_ratio:
+            original = rng.choice(base)
+            kind = rng.choice(DUPLICATE_KINDS)
+            agency = dict(original, belge_no=belge_no)
+            if kind == 'branch':
+                agency['telefon'] = f"0{rng.choice(('232', '242', '252'))} {i % 900 + 100} {i % 89 + 10} {i % 83 + 10}"
+                agency['faks'] = None
+            elif kind == 'renamed':
+                agency['acenta_adi'] = original['acenta_adi'].replace("TURİZM SEYAHAT ACENTASI", "TUR. SEY. LTD. ŞTİ.")
+                agency['email'] = f"{fold_name(_syllable_word(rng))}{i}@gmail.com"
+            else:
+                name = original['acenta_adi']
+                position = rng.randrange(len(name.split()[0]))
+                agency['acenta_adi'] = name[:position] + name[position + 1:]
+                agency['telefon'] = f"0216 {i % 900 + 100} {i % 89 + 10} {i % 83 + 10}"
+                agency['faks'] = None
+                agency['email'] = f"{fold_name(_syllable_word(rng))}{i}@hotmail.com"
+            truth[belge_no] = truth[original['belge_no']]
+        else:
+            words = f"{_syllable_word(rng)} {_syllable_word(rng)}"
+            slug = fold_name(words)
+            agency = {
+                'belge_no': belge_no,
+                'acenta_adi': f"{words} TURİZM SEYAHAT ACENTASI",
+                'telefon': f"0212 {i // 10000 + 100} {i // 100 % 100:02d} {i % 100:02d}",
+                'faks': f"0212 {i // 10000 + 500} {i // 100 % 100:02d} {i % 100:02d}",
+                'email': (f"info@{slug.replace(' ', '')}{i}.com.tr" if rng.random() < 0.7
+                          else f"{slug.replace(' ', '.')}{i}@gmail.com"),
+                'adres': f"ÖRNEK MAH. NO:{i}", 'ilce': "ŞİŞLİ", 'sehir': "İSTANBUL", 'btk': "İSTANBUL",
+            }
+            base.append(agency)
+            truth[belge_no] = belge_no
+        agencies.append(agency)
+    return agencies, truth
+
+
+def _pairs(labels):
+    return sum(size * (size - 1) // 2 for size in collections.Counter(labels).values())
+
+
+def cluster_quality(predicted, truth):
+    """Tekrar çiftleri üzerinden kesinlik ve duyarlılık (belge_no -> küme eşlemeleri)"""
+    groups = collections.defaultdict(list)
+    for belge_no, cluster in predicted.items():
+        groups[cluster].append(belge_no)
+    correct = sum(_pairs(truth[belge_no] for belge_no in members) for members in groups.values())
+    predicted_pairs, true_pairs = _pairs(predicted.values()), _pairs(truth.values())
+    return (correct / predicted_pairs if predicted_pairs else 1.0), (correct / true_pairs if true_pairs else 1.0)
+
+
+def _insert_agencies(conn, agencies):
+    """Acentaları kümeleme tetiklemeden (normalize edilmiş halde) tabloya ekle"""
+    rows = []
+    for record in prepare_records(agencies):
+        row = record.as_dict()
+        row.update(content_hash=agency_content_hash(row), acenta_adi_norm=fold_name(row['acenta_adi']))
+        rows.append(row)
+    conn.execute(Agency.__table__.insert(), rows)
+
+
+def _stored_clusters(db):
+    with db.engine.connect() as conn:
+        return dict(conn.execute(text("SELECT belge_no, cluster_id FROM agencies")).all())
+
+
+def bench_dedup(rows, duplicate_ratio, new_rows, batch_size):
+    """Tekrar kümeleme: bellek içi, tam yeniden hesaplama ve artımlı atama süresi ve doğruluğu"""
+    agencies, truth = make_duplicate_agencies(rows + new_rows, duplicate_ratio)
+    existing, incoming = agencies[:rows], agencies[rows:]
+    records = prepare_records(existing)
+
+    start = time.perf_counter()
+    index = DuplicateIndex()
+    for agency_id, (core, keys) in enumerate(agency_blocking_keys(records)):
+        index.add(agency_id, core, keys)
+    keys_time = time.perf_counter() - start
+    index.link()
+    memory_time = time.perf_counter() - start
+    clusters = index.clusters()
+    precision, recall = cluster_quality({record.belge_no: clusters[i] for i, record in enumerate(records)},
+                                        {record.belge_no: truth[record.belge_no] for record in records})
+    print(f"{'bellek içi':>12}: {rows / memory_time:10.0f} kayıt/s ({memory_time:.2f}s, anahtarlar {keys_time:.2f}s), "
+          f"{index.comparisons} ad karşılaştırması, {index.skipped_blocks} kalabalık blok atlandı")
+    print(f"{'':>12}  kesinlik {precision:.3f}, duyarlılık {recall:.3f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = DatabaseManager(f"sqlite:///{os.path.join(tmp, 'dedup.db')}")
+        with db.engine.begin() as conn:
+            _insert_agencies(conn, existing)
+        summary, elapsed = _timed(db.rebuild_clusters)
+        print(f"{'rebuild':>12}: {rows / elapsed:10.0f} kayıt/s ({elapsed:.2f}s), {summary['clusters']} küme, "
+              f"{summary['duplicates']} kayıt")
+
+        latencies = []
+        for start in range(0, len(incoming), batch_size):
+            batch = incoming[start:start + batch_size]
+            with db.engine.begin() as conn:
+                _insert_agencies(conn, batch)
+            _, elapsed = _timed(db.assign_clusters, [agency['belge_no'] for agency in batch])
+            latencies.append(elapsed)
+        incremental = _stored_clusters(db)
+        precision, recall = cluster_quality(incremental, truth)
+        _report_latency(f"artımlı {batch_size}", latencies)
+        print(f"{'':>12}  {len(incoming)} yeni kayıt: kesinlik {precision:.3f}, duyarlılık {recall:.3f}")
+
+        _timed(db.rebuild_clusters)
+        rebuilt = _stored_clusters(db)
+        same = cluster_quality(incremental, rebuilt) == (1.0, 1.0)
+        print(f"artımlı sonuç tam yeniden hesaplama ile aynı: {'evet' if same else 'hayır'}")
+        db.engine.dispose()
+
+
+QUERY_INDEXES = ('ix_agencies_sehir_ilce_id', 'ix_agencies_btk_id', 'ix_agencies_acenta_adi_norm')
+
+
+def _query_cases(rng):
+    """Her çağrıda rastgele filtre değerleriyle sorgu senaryoları üret"""
+    sehir = rng.choice(list(CITIES))
+    word = rng.choice(NAME_WORDS)
+    return {
+        "sehir": dict(sehir=sehir),
+        "sehir+ilce": dict(sehir=sehir, ilce=rng.choice(CITIES[sehir])),
+        "nadir sehir+ilce": dict(sehir="NEVŞEHİR", ilce=rng.choice(CITIES["NEVŞEHİR"])),
+        "btk": dict(btk=rng.choice(list(CITIES))),
+        "ad prefix": dict(name=f"{word.lower()} {rng.choice(NAME_WORDS)[:2]}"),
+        "ad contains": dict(name=rng.choice(NAME_WORDS).lower(), name_match='contains'),
+    }
+
+
+def _bench_queries(db, iterations, limit, pages):
+    rng = random.Random(1)
+    samples = {}
+    for _ in range(iterations):
+        for label, filters in _query_cases(rng).items():
+            after_id = None
+            for _ in range(pages):
+                start = time.perf_counter()
+                agencies, after_id = db.query_agencies(limit=limit, after_id=after_id, **filters)
+                samples.setdefault(label, []).append(time.perf_counter() - start)
+                if after_id is None:
+                    break
+    for label, values in samples.items():
+        _report_latency(label, values)
+
+
+def bench_query(rows, iterations, limit, pages):
+    """query_agencies sayfa gecikmesi: indexli ve indexsiz tablo"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = DatabaseManager(f"sqlite:///{os.path.join(tmp, 'query.db')}")
+        start = time.perf_counter()
+        populate_agencies(db, rows, factory=make_directory_agencies)
+        with db.engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        print(f"{rows} satır oluşturuldu ({time.perf_counter() - start:.1f}s), "
+              f"sayfa {limit} satır, senaryo başına {pages} sayfa")
+
+        print("indexli:")
+        _bench_queries(db, iterations, limit, pages)
+
+        with db.engine.begin() as conn:
+            for name in QUERY_INDEXES:
+                conn.execute(text(f"DROP INDEX {name}"))
+            conn.execute(text("ANALYZE"))
+        print("indexsiz:")
+        _bench_queries(db, iterations, limit, pages)
+        db.engine.dispose()
+
+
+def _run_threads(threads, ops, func):
+    """threads adet thread'de func'ı ops kez çalıştır, toplam işlem/sn döndür"""
+    def worker():
+        for i in range(ops):
+            func(i)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def bench_pool(threads, ops, pool_size):
+    """Paylaşılan engine ve çağrı başına yeni engine ile çok thread'li okuma/yazma"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{os.path.join(tmp, 'pool.db')}"
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = DatabaseManager(db_url, pool_size=pool_size, max_overflow=0)
+            db.save_agencies(make_agencies(1000), bulk=True)
+
+        def shared(i):
+            db.get_agency_by_belge_no(str(1000 + i % 1000))
+
+        def per_call(i):
+            # Eski davranış: her bağlantı için yeni engine (ve yeni fiziksel bağlantı)
+            engine = create_engine(db_url)
+            with engine.connect() as conn:
+                conn.execute(text("SELECT * FROM agencies WHERE belge_no = :b"), {'b': str(1000 + i % 1000)}).all()
+            engine.dispose()
+
+        rate = _run_threads(threads, ops, shared)
+        pool = db.pool_status()
+        print(f"paylaşılan engine: {rate:8.0f} işlem/s, {pool['connects']} bağlantı, {pool['checkouts']} checkout, "
+              f"en fazla {pool['peak_checked_out']}/{pool_size} eş zamanlı, {pool['waits']} bekleme, "
+              f"alma p95 {pool['acquire_p95'] * 1000:.1f} ms")
+        rate = _run_threads(threads, ops, per_call)
+        print(f"çağrı başına engine: {rate:6.0f} işlem/s, {threads * ops} bağlantı")
+        dispose_engines()
+
+
+def bench_driver(instances, searches):
+    """Chrome: soğuk başlangıç, havuzdan ödünç alma ve örnek başına bellek"""
+    from tursab_bot import TursabBot
+
+    start = time.perf_counter()
+    resolve_chromedriver_path()
+    print(f"chromedriver çözümleme: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    start = time.perf_counter()
+    driver = launch_chrome(headless=True)
+    cold = time.perf_counter() - start
+    print(f"soğuk başlangıç: {cold:8.2f} s, RSS {_format_mb(process_tree_rss_mb(driver.service.process.pid))}")
+    driver.quit()
+
+    agencies = make_agencies(searches)
+    hits = {agency['belge_no']: [agency] for agency in agencies}
+    codes = [agency['belge_no'] for agency in agencies]
+    with MockTursabServer(hits=hits) as server:
+        pool = DriverPool(size=instances, max_searches=0)
+        try:
+            samples = []
+            for _ in range(instances * 2):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    bot = TursabBot(search_url=server.url, driver_pool=pool)
+                    bot.open_site()
+                samples.append(time.perf_counter() - start)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for code in codes:
+                        bot.search_agency(code)
+                        bot.extract_agency_data()
+                    bot.close()
+            _report_latency("havuzdan bot + açılış", samples)
+            stats = pool.stats()
+            print(f"havuz: {stats['cold_starts']} soğuk başlangıç (ort {stats['cold_start_mean']:.2f}s), "
+                  f"{stats['leases']} ödünç")
+            for index, rss in enumerate(stats['rss_mb'], 1):
+                print(f"  örnek {index}: RSS {_format_mb(rss)}")
+        finally:
+            pool.close()
+
+
+def bench_browser(searches, profiles):
+    """Tarayıcı profilleri: sayfa yükleme, arama süresi, aktarılan byte ve Chrome RSS
+
+    Yerel sunucu sayfaya görsel, font ve CSS ekler; byte'lar sunucu tarafında sayılır.
+    """
+    from tursab_bot import TursabBot
+
+    agencies = make_agencies(searches)
+    hits = {agency['belge_no']: [agency] for agency in agencies}
+    codes = [agency['belge_no'] for agency in agencies]
+    with MockTursabServer(hits=hits, assets=True) as server:
+        for profile in profiles:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                bot = TursabBot(search_url=server.url, browser_profile=profile)
+            cold = time.perf_counter() - start
+            try:
+                served = server.bytes_served
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    bot.open_site()
+                load = time.perf_counter() - start
+                load_bytes = server.bytes_served - served
+
+                served = server.bytes_served
+                samples = []
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for code in codes:
+                        start = time.perf_counter()
+                        bot.search_agency(code)
+                        bot.extract_agency_data()
+                        samples.append(time.perf_counter() - start)
+                search_kb = (server.bytes_served - served) / len(codes) / 1024
+                rss = process_tree_rss_mb(bot.driver.service.process.pid)
+                print(f"{profile:>8}: başlangıç {cold:5.2f}s, sayfa yükleme {load * 1000:7.1f} ms / "
+                      f"{load_bytes / 1024:7.1f} KB, arama başına {search_kb:6.1f} KB, RSS {_format_mb(rss)}")
+                _report_latency(f"{profile} arama", samples)
+            finally:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    bot.close()
+
+
+REPLAY_STAGES = ('search', 'extract_agency_data', 'parse_container', 'save_agencies')
+
+
+def record_mock_fixtures(directory, codes, hit_ratio, error_ratio=0.05):
+    """Yerel sunucuya karşı --record ile aynı yoldan fixture kaydet (found, empty ve error kodları)"""
+    agencies = make_agencies(codes)
+    rng = random.Random(17)
+    hits, errors = {}, set()
+    for agency in agencies:
+        roll = rng.random()
+        if roll < hit_ratio:
+            hits[agency['belge_no']] = [agency]
+        elif roll < hit_ratio + error_ratio:
+            errors.add(agency['belge_no'])
+
+    recorder = FixtureRecorder(directory, limit_per_status=0)
+    with MockTursabServer(hits=hits, error_codes=errors) as server:
+        scheduler = ScanScheduler(lambda: HttpSearchBackend(search_url=server.url),
+                                  [agency['belge_no'] for agency in agencies], rate=0, recorder=recorder)
+        _timed(scheduler.run)
+    recorder.close()
+    return recorder.counts
+
+
+def _replay_backend(variant, url):
+    """Replay varyantı için backend oluştur: http, selenium-html veya selenium-selenium"""
+    if variant == 'http':
+        return HttpSearchBackend(search_url=url, pacing=PacingPolicy())
+    from tursab_bot import TursabBot
+
+    bot = TursabBot(search_url=url, pacing=PacingPolicy(typing_delay=(0, 0)),
+                    parser=variant.split('-', 1)[1], browser_profile='lean')
+    bot.capture_html = True
+    return bot
+
+
+RESULT_CONTAINERS = "#ContentPlaceHolder1_ResultPanel .lit-container"
+
+
+def _agency_containers(backend):
+    """Son sonuç sayfasındaki acenta konteynerleri ve onları parse eden fonksiyon"""
+    if isinstance(backend, HttpSearchBackend) or backend.parser == 'html':
+        soup = BeautifulSoup(backend.page_html() or "", 'html.parser')
+        return soup.select(RESULT_CONTAINERS), parse_agency_container_html
+    from selenium.webdriver.common.by import By
+
+    return backend.driver.find_elements(By.CSS_SELECTOR, RESULT_CONTAINERS), backend._parse_agency_container
+
+
+def _replay_variant(variant, url, codes, db):
+    """Her kod için arama, veri çekme, konteyner parse ve kaydetme sürelerini ölç"""
+    samples = {stage: [] for stage in REPLAY_STAGES}
+    with contextlib.redirect_stdout(io.StringIO()):
+        backend = _replay_backend(variant, url)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            backend.open_site()
+            for code in codes:
+                start = time.perf_counter()
+                backend.search_agency(code)
+                samples['search'].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                agencies = backend.extract_agency_data()
+                samples['extract_agency_data'].append(time.perf_counter() - start)
+                if not agencies:
+                    continue
+
+                containers, parse_container = _agency_containers(backend)
+                start = time.perf_counter()
+                for container in containers:
+                    parse_container(container)
+                samples['parse_container'].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                db.save_agencies(agencies)
+                samples['save_agencies'].append(time.perf_counter() - start)
+                backend.clear_results()
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            backend.close()
+    return samples
+
+
+def _summarize(samples):
+    """Gecikme örneklerini {median, p95} (ms) olarak özetle"""
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1] if len(samples) >= 20 else samples[-1]
+    return {'median': round(statistics.median(samples) * 1000, 3), 'p95': round(p95 * 1000, 3),
+            'count': len(samples)}
+
+
+def compare_baseline(results, baseline, tolerance, min_delta_ms=0.05):
+    """Medyanı tabandan tolerance oranından (ve en az min_delta_ms) fazla yavaşlayan (varyant, aşama) çiftleri"""
+    regressions = []
+    for variant, stages in results.items():
+        for stage, summary in stages.items():
+            reference = baseline.get(variant, {}).get(stage)
+            if not reference or not reference.get('median'):
+                continue
+            change = summary['median'] / reference['median'] - 1
+            if change > tolerance and summary['median'] - reference['median'] > min_delta_ms:
+                regressions.append((variant, stage, reference['median'], summary['median'], change))
+    return regressions
+
+
+def bench_replay(fixtures, codes, hit_ratio, browser, baseline, update_baseline, tolerance):
+    """Kaydedilmiş fixture'lar üzerinde uçtan uca hattı (arama → veri çekme → parse → kayıt) ölç
+
+    Fixture dizini verilmezse yerel sunucudan geçici bir kayıt alınır. --baseline ile
+    verilen JSON dosyasına göre medyanı tolerance'tan fazla yavaşlayan aşama varsa 1 döndürür.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        if fixtures is None:
+            fixtures = os.path.join(tmp, "fixtures")
+            counts = record_mock_fixtures(fixtures, codes, hit_ratio)
+            print(f"📼 Yerel sunucudan kaydedildi: "
+                  f"{', '.join(f'{status} {count}' for status, count in sorted(counts.items()))}")
+        replay_codes = sorted(load_fixtures(fixtures))
+        print(f"📼 {len(replay_codes)} fixture yeniden oynatılıyor")
+
+        variants = ['http'] + (['selenium-html', 'selenium-selenium'] if browser else [])
+        results = {}
+        with ReplayTursabServer(fixtures) as server:
+            for variant in variants:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    db = DatabaseManager(f"sqlite:///{os.path.join(tmp, f'{variant}.db')}")
+                try:
+                    samples = _replay_variant(variant, server.url, replay_codes, db)
+                finally:
+                    dispose_engines()
+                results[variant] = {stage: _summarize(values) for stage, values in samples.items() if values}
+                for stage, values in samples.items():
+                    if values:
+                        _report_latency(f"{variant} {stage}", values)
+
+    if update_baseline and baseline:
+        with open(baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"💾 Taban değerler {baseline} dosyasına yazıldı")
+        return 0
+
+    if baseline:
+        with open(baseline, encoding='utf-8') as f:
+            regressions = compare_baseline(results, json.load(f), tolerance)
+        for variant, stage, before, after, change in regressions:
+            print(f"❌ {variant} {stage}: median {before:.2f} → {after:.2f} ms (+{change:.0%})")
+        if regressions:
+            return 1
+        print(f"✅ Taban değerlere göre %{tolerance * 100:g}'den büyük gerileme yok")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TÜRSAB bot benchmark'ları")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    save_parser = subparsers.add_parser('save', help="save_agencies rows/sec karşılaştırması")
+    save_parser.add_argument('--rows', type=int, default=20000)
+    save_parser.add_argument('--batch-size', type=int, default=1000)
+
+    parse_parser = subparsers.add_parser('parse', help="sayfa başına parse gecikmesi")
+    parse_parser.add_argument('--iterations', type=int, default=200)
+    parse_parser.add_argument('--browser', action='store_true',
+                              help="eski element bazlı yolu Chrome ile de ölç")
+
+    search_parser = subparsers.add_parser('search', help="yerel sunucuya karşı searches/sec ve bellek")
+    search_parser.add_argument('--searches', type=int, default=500)
+    search_parser.add_argument('--hit-ratio', type=float, default=0.3)
+    search_parser.add_argument('--browser', action='store_true',
+                               help="Selenium/Chrome backend'ini de ölç")
+
+    scan_parser = subparsers.add_parser('scan', help="çok worker'lı taramayı yerel sunucuya karşı çalıştır")
+    scan_parser.add_argument('--codes', type=int, default=2000)
+    scan_parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8])
+    scan_parser.add_argument('--rate', type=float, default=0, help="toplam istek/sn sınırı (0 = sınırsız)")
+    scan_parser.add_argument('--hit-ratio', type=float, default=0.1)
+    scan_parser.add_argument('--latency', type=float, default=0.01, help="sunucu yanıt gecikmesi (s)")
+    scan_parser.add_argument('--flaky-ratio', type=float, default=0.0,
+                             help="ilk denemede geçici \"Hata\" paneli döndüren kod oranı")
+
+    plan_parser = subparsers.add_parser('plan', help="tarama planı kapsama simülasyonu")
+    plan_parser.add_argument('--hit-map', help="found kodlarının okunacağı scan-state dosyası")
+    plan_parser.add_argument('--db-url', help="isabet haritası olarak kullanılacak agencies tablosu")
+    plan_parser.add_argument('--start', type=int, default=1000)
+    plan_parser.add_argument('--end', type=int, default=100000)
+    plan_parser.add_argument('--history', type=float, default=0.8,
+                             help="isabetlerin önceden bilinen oranı (agencies tablosu)")
+    plan_parser.add_argument('--block-size', type=int, default=100)
+    plan_parser.add_argument('--sample-stride', type=int, default=10)
+
+    export_parser = subparsers.add_parser('export', help="akışlı dışa aktarma süresi ve tepe belleği")
+    export_parser.add_argument('--rows', type=int, default=1000000)
+    export_parser.add_argument('--formats', nargs='+', default=['csv', 'parquet', 'xlsx'])
+    export_parser.add_argument('--chunk-size', type=int, default=5000)
+
+    query_parser = subparsers.add_parser('query', help="query_agencies sayfa gecikmesi (indexli/indexsiz)")
+    query_parser.add_argument('--rows', type=int, default=500000)
+    query_parser.add_argument('--iterations', type=int, default=50)
+    query_parser.add_argument('--limit', type=int, default=100)
+    query_parser.add_argument('--pages', type=int, default=3)
+
+    pool_parser = subparsers.add_parser('pool', help="bağlantı havuzu: paylaşılan engine ve çağrı başına engine")
+    pool_parser.add_argument('--threads', type=int, default=8)
+    pool_parser.add_argument('--ops', type=int, default=500)
+    pool_parser.add_argument('--pool-size', type=int, default=4)
+
+    driver_parser = subparsers.add_parser('driver', help="Chrome soğuk başlangıç, havuz ve bellek (Chrome gerekir)")
+    driver_parser.add_argument('--instances', type=int, default=2)
+    driver_parser.add_argument('--searches', type=int, default=50, help="ödünç başına arama sayısı")
+
+    browser_parser = subparsers.add_parser('browser', help="Chrome profilleri: yükleme, byte ve bellek (Chrome gerekir)")
+    browser_parser.add_argument('--searches', type=int, default=50)
+    browser_parser.add_argument('--profiles', nargs='+', default=['default', 'lean'])
+
+    records_parser = subparsers.add_parser('records', help="kayıt başına bellek ve normalizasyon hızı")
+    records_parser.add_argument('--rows', type=int, default=100000)
+
+    dedup_parser = subparsers.add_parser('dedup', help="tekrar kümeleme süresi ve doğruluğu (tam ve artımlı)")
+    dedup_parser.add_argument('--rows', type=int, default=100000)
+    dedup_parser.add_argument('--duplicate-ratio', type=float, default=0.2)
+    dedup_parser.add_argument('--new-rows', type=int, default=1000, help="artımlı olarak eklenecek kayıt sayısı")
+    dedup_parser.add_argument('--batch-size', type=int, default=100, help="artımlı kayıt batch büyüklüğü")
+
+    startup_parser = subparsers.add_parser('startup', help="import süresi ve ilk sorguya kadar soğuk başlangıç")
+    startup_parser.add_argument('--repeats', type=int, default=5)
+
+    replay_parser = subparsers.add_parser('replay', help="kaydedilmiş fixture'larla uçtan uca hat ve gerileme kontrolü")
+    replay_parser.add_argument('--fixtures', default=None,
+                               help="tursab_bot.py --record dizini (verilmezse yerel sunucudan kaydedilir)")
+    replay_parser.add_argument('--codes', type=int, default=300, help="yerel kayıt için kod sayısı")
+    replay_parser.add_argument('--hit-ratio', type=float, default=0.5)
+    replay_parser.add_argument('--browser', action='store_true',
+                               help="Selenium html ve selenium parser'larını da ölç (Chrome gerekir)")
+    replay_parser.add_argument('--baseline', default=None, help="karşılaştırılacak taban JSON dosyası")
+    replay_parser.add_argument('--update-baseline', action='store_true', help="sonuçları --baseline dosyasına yaz")
+    replay_parser.add_argument('--tolerance', type=float, default=0.2, help="izin verilen medyan yavaşlama oranı")
+
+    args = parser.parse_args()
+
+    if args.command == 'save':
+        bench_save(args.rows, args.batch_size)
+    elif args.command == 'parse':
+        bench_parse(args.iterations, args.browser)
+    elif args.command == 'search':
+        bench_search(args.searches, args.hit_ratio, args.browser)
+    elif args.command == 'scan':
+        bench_scan(args.codes, args.workers, args.rate, args.hit_ratio, args.latency, args.flaky_ratio)
+    elif args.command == 'plan':
+        bench_plan(args.hit_map, args.db_url, args.start, args.end, args.history,
+                   args.block_size, args.sample_stride)
+    elif args.command == 'export':
+        bench_export(args.rows, args.formats, args.chunk_size)
+    elif args.command == 'query':
+        bench_query(args.rows, args.iterations, args.limit, args.pages)
+    elif args.command == 'pool':
+        bench_pool(args.threads, args.ops, args.pool_size)
+    elif args.command == 'driver':
+        bench_driver(args.instances, args.searches)
+    elif args.command == 'browser':
+        bench_browser(args.searches, args.profiles)
+    elif args.command == 'records':
+        bench_records(args.rows)
+    elif args.command == 'dedup':
+        bench_dedup(args.rows, args.duplicate_ratio, args.new_rows, args.batch_size)
+    elif args.command == 'startup':
+        bench_startup(args.repeats)
+    elif args.command == 'replay':
+        sys.exit(bench_replay(args.fixtures, args.codes, args.hit_ratio, args.browser, args.baseline,
+                              args.update_baseline, args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""TÜRSAB acenta arama formunu taklit eden yerel sunucu
+
+Benchmark ve offline denemeler için canlı siteye gitmeden aynı
+ContentPlaceHolder1_* ID'lerini ve WebForms postback akışını sunar.
+
+Kullanım:
+    python3 mock_server.py --port 8765
+    python3 mock_server.py --fixtures fixtures/   # tursab_bot.py --record çıktısını yeniden oynat
+"""
+import argparse
+import html
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from tursab_bot import NO_RESULT_TEXT, load_fixtures
+
+SEARCH_PATH = "/acenta-arama"
+INPUT_NAME = "ctl00$ContentPlaceHolder1$TursabNoText"
+SEARCH_BUTTON_NAME = "ctl00$ContentPlaceHolder1$SearchButton"
+CLEAN_BUTTON_NAME = "ctl00$ContentPlaceHolder1$CleanButton"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="tr">
+<head>
+    <meta charset="utf-8">
+    <title>Acenta Arama - TÜRSAB</title>
+{head}
+</head>
+<body>
+{banner}
+<form method="post" action=".{path}" id="form1">
+    <input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}">
+    <input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="{eventvalidation}">
+    <div class="w3-container">
+        <input name="{input_name}" type="text" value="{code}" id="ContentPlaceHolder1_TursabNoText" class="w3-input">
+        <input type="submit" name="{search_name}" value="Ara" id="ContentPlaceHolder1_SearchButton" class="w3-button">
+        <input type="submit" name="{clean_name}" value="Temizle" id="ContentPlaceHolder1_CleanButton" class="w3-button">
+    </div>
+{body}
+</form>
+</body>
+</html>
+"""
+
+
+ASSET_PATH = "/assets/"
+# assets=True ile sayfaya eklenen, canlı sitedeki gibi ağır statik kaynaklar (ad: (content-type, boyut))
+ASSETS = {
+    "site.css": ("text/css", 30 * 1024),
+    "font.woff2": ("font/woff2", 120 * 1024),
+    **{f"banner-{index}.jpg": ("image/jpeg", 150 * 1024) for index in range(1, 7)},
+    "logo.png": ("image/png", 40 * 1024),
+}
+ASSET_HEAD = f'    <link rel="stylesheet" href="{ASSET_PATH}site.css">'
+ASSET_BANNER = "\n".join(
+    f'<img src="{ASSET_PATH}{name}" alt="">' for name, (content_type, _) in ASSETS.items()
+    if content_type.startswith("image/")
+)
+
+
+def render_asset(name):
+    """Statik kaynağın gövdesi; CSS fontu da yükletir"""
+    content_type, size = ASSETS[name]
+    if name == "site.css":
+        css = (f"@font-face {{ font-family: 'Tursab'; src: url('{ASSET_PATH}font.woff2') format('woff2'); }}\n"
+               "body { font-family: 'Tursab', sans-serif; }\n")
+        return content_type, (css + "/*" + " " * (size - len(css) - 4) + "*/").encode("utf-8")
+    return content_type, bytes(size)
+
+
+def render_agency(agency):
+    """Tek acentayı lit-container HTML'ine çevir"""
+    e = {key: html.escape(value or "") for key, value in agency.items()}
+    phone_lines = []
+    if e.get('telefon'):
+        phone_lines.append(f"Telefon : {e['telefon']}")
+    if e.get('faks'):
+        phone_lines.append(f"Faks : {e['faks']}")
+    email = f"Email : {e['email']}" if e.get('email') else ""
+    # Parser adresi ilçe/şehir dahil döndürür; kalın yazılan kısmı tekrar etme
+    street = e.get('adres', '')
+    suffix = f"{e.get('ilce', '')} / {e.get('sehir', '')}"
+    if street.endswith(suffix):
+        street = street[:-len(suffix)].strip()
+    return f"""        <div class="lit-container">
+            <div class="w3-row">
+                <div class="w3-col l1"><div class="litc">{e.get('belge_no', '')}</div></div>
+                <div class="w3-col l5"><div class="litc">Acenta Adı : {e.get('acenta_adi', '')}</div></div>
+                <div class="w3-col l3"><div class="litc">{'<br>'.join(phone_lines)}</div></div>
+                <div class="w3-col l3"><div class="litc">{email}</div></div>
+            </div>
+            <div class="w3-row">
+                <div class="lit2">Adres : {street} <b>{e.get('ilce', '')}</b> / <b>{e.get('sehir', '')}</b></div>
+            </div>
+            <div class="w3-row">
+                <div class="lit2">BTK : {e.get('btk', '')}</div>
+            </div>
+        </div>"""
+
+
+def render_result_body(agencies):
+    """Arama sonucunu (ResultPanel veya FormMessagePanel) HTML'e çevir"""
+    if agencies:
+        containers = "\n".join(render_agency(agency) for agency in agencies)
+        return f'    <div id="ContentPlaceHolder1_ResultPanel">\n{containers}\n    </div>'
+    return render_message_body(f"{NO_RESULT_TEXT}.")
+
+
+def render_message_body(message):
+    """FormMessagePanel içinde kırmızı mesaj paneli üret"""
+    return f"""    <div id="ContentPlaceHolder1_FormMessagePanel">
+        <div class="w3-panel w3-pale-red">
+            <p>{html.escape(message)}</p>
+        </div>
+    </div>"""
+
+
+class MockTursabServer:
+    """Arama formunu taklit eden thread'li yerel HTTP sunucusu"""
+
+    def __init__(self, hits=None, host="127.0.0.1", port=0, latency=0.0, error_codes=None, assets=False,
+                 flaky_codes=None):
+        # hits: {belge_no: [acenta dict, ...]}
+        self.hits = hits or {}
+        self.error_codes = set(error_codes or ())
+        # flaky_codes: ilk denemede "Hata" paneli döndüren kodlar ({kod: hata sayısı} veya kod listesi)
+        if isinstance(flaky_codes, dict):
+            self.flaky_codes = dict(flaky_codes)
+        else:
+            self.flaky_codes = dict.fromkeys(flaky_codes or (), 1)
+        self.latency = latency
+        # assets=True: sayfa görsel, font ve CSS referansları içerir (tarayıcı profili benchmark'ı için)
+        self.assets = assets
+        self.requests_served = 0
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+        self._states = set()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{SEARCH_PATH}"
+
+    def _new_state(self):
+        """Her yanıt için yeni __VIEWSTATE/__EVENTVALIDATION çifti üret"""
+        viewstate, eventvalidation = secrets.token_hex(16), secrets.token_hex(8)
+        with self._lock:
+            self._states.add((viewstate, eventvalidation))
+        return viewstate, eventvalidation
+
+    def _check_state(self, viewstate, eventvalidation):
+        with self._lock:
+            return (viewstate, eventvalidation) in self._states
+
+    def render_page(self, code="", body=""):
+        viewstate, eventvalidation = self._new_state()
+        return PAGE_TEMPLATE.format(
+            head=ASSET_HEAD if self.assets else "", banner=ASSET_BANNER if self.assets else "",
+            path=SEARCH_PATH, viewstate=viewstate, eventvalidation=eventvalidation,
+            input_name=INPUT_NAME, search_name=SEARCH_BUTTON_NAME, clean_name=CLEAN_BUTTON_NAME,
+            code=html.escape(code), body=body,
+        )
+
+    def respond(self, form):
+        """POST edilen form alanlarına göre sayfa gövdesini üret"""
+        first = lambda key: form.get(key, [""])[0]
+        if not self._check_state(first("__VIEWSTATE"), first("__EVENTVALIDATION")):
+            return 500, self.render_page(body=render_message_body("Hata: Geçersiz sayfa durumu"))
+
+        if CLEAN_BUTTON_NAME in form:
+            return 200, self.render_page()
+
+        code = first(INPUT_NAME).strip()
+        status, body = self.render_result(code)
+        return status, self.render_page(code=code, body=body)
+
+    def render_result(self, code):
+        """Kod için (HTTP durumu, sonuç paneli HTML'i) döndür"""
+        if code in self.error_codes or self._take_flaky(code):
+            return 200, render_message_body("Hata oluştu, lütfen daha sonra tekrar deneyiniz")
+        return 200, render_result_body(self.hits.get(code))
+
+    def _take_flaky(self, code):
+        with self._lock:
+            if self.flaky_codes.get(code, 0) <= 0:
+                return False
+            self.flaky_codes[code] -= 1
+            return True
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status, body, content_type="text/html; charset=utf-8"):
+                payload = body.encode("utf-8") if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                with server._lock:
+                    server.bytes_served += len(payload)
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if server.assets and path.startswith(ASSET_PATH) and path[len(ASSET_PATH):] in ASSETS:
+                    content_type, payload = render_asset(path[len(ASSET_PATH):])
+                    self._send(200, payload, content_type)
+                    return
+                if path != SEARCH_PATH:
+                    self._send(404, "Not Found")
+                    return
+                with server._lock:
+                    server.requests_served += 1
+                self._send(200, server.render_page())
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.requests_served += 1
+                self._send(*server.respond(form))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ReplayTursabServer(MockTursabServer):
+    """tursab_bot.py --record ile kaydedilmiş sonuç panellerini aynı postback akışıyla sunar
+
+    Kaydı olmayan kodlar boş sonuç döndürür; paneli olmayan hata kayıtları 500 ile yanıtlanır.
+    """
+
+    def __init__(self, fixtures_dir, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures = load_fixtures(fixtures_dir)
+
+    def render_result(self, code):
+        fixture = self.fixtures.get(code)
+        if fixture is None:
+            return 200, render_result_body(None)
+        status, panel = fixture
+        if panel is None:
+            return (500 if status == 'error' else 200), ""
+        return 200, panel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel TÜRSAB arama formu")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="POST başına yapay gecikme (s)")
+    parser.add_argument('--assets', action='store_true', help="sayfaya görsel, font ve CSS ekle")
+    parser.add_argument('--fixtures', default=None, metavar='DIR',
+                        help="sentetik veri yerine tursab_bot.py --record ile kaydedilmiş panelleri sun")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        server = ReplayTursabServer(args.fixtures, port=args.port, latency=args.latency, assets=args.assets)
+        print(f"📼 {len(server.fixtures)} fixture yüklendi")
+    else:
+        from benchmark import make_agencies
+
+        hits = {agency['belge_no']: [agency] for agency in make_agencies(500)}
+        server = MockTursabServer(hits=hits, port=args.port, latency=args.latency, assets=args.assets)
+    print(f"🚀 Yerel sunucu: {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import pathlib
+import sys
+
+import pytest
+
+# Repo paketlenmediği için modüller kök dizinden import edilir
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mock_server import MockTursabServer  # noqa: E402
+from tursab_bot import DatabaseManager, dispose_engines  # noqa: E402
+
+FIXTURES_DIR = ROOT / "fixtures"
+
+
+def make_agency(code, **overrides):
+    """Mock sunucuya ve save_agencies'e verilebilecek acenta dict'i"""
+    agency = {
+        'belge_no': str(code),
+        'acenta_adi': f"ÖRNEK {code} TURİZM SEYAHAT ACENTASI",
+        'telefon': f"0212 555 {code % 100:02d} {code % 97:02d}",
+        'faks': "",
+        'email': f"info{code}@ornek{code}.com",
+        'adres': f"ÖRNEK MAH. NO:{code}",
+        'ilce': "ŞİŞLİ",
+        'sehir': "İSTANBUL",
+        'btk': "İSTANBUL",
+    }
+    agency.update(overrides)
+    return agency
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    yield manager
+    dispose_engines()
+
+
+@pytest.fixture
+def mock_server():
+    """Her üçüncü kodu (1000, 1003, ...) bulan yerel arama sunucusu"""
+    hits = {str(code): [make_agency(code)] for code in range(1000, 1100, 3)}
+    with MockTursabServer(hits=hits) as server:
+        yield server
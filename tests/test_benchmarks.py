@@ -0,0 +1,115 @@
+"""pytest-benchmark ile sıcak yolların mikro ölçümleri
+
+Arama, extract_agency_data ve konteyner parse ölçümleri her backend/parser varyantı için
+(http, selenium-html, selenium-selenium) benchmark.py replay ile aynı yoldan çalışır; Chrome
+kurulu değilse selenium varyantları atlanır. python -m pytest tests/test_benchmarks.py
+--benchmark-autosave ile kaydedip --benchmark-compare ile önceki çalışmayla karşılaştırın.
+pytest-benchmark kurulu değilse tüm dosya atlanır.
+"""
+import contextlib
+import io
+import random
+import string
+
+import pytest
+
+from conftest import FIXTURES_DIR, make_agency
+from mock_server import MockTursabServer
+from tursab_bot import AgencyRecord, DuplicateIndex, _chrome_version, agency_blocking_keys, parse_result_page
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmark import _agency_containers, _replay_backend  # noqa: E402
+
+VARIANTS = ('http', 'selenium-html', 'selenium-selenium')
+FOUND_CODE = "1000"
+
+
+@pytest.fixture(scope='module')
+def variant_server():
+    # Şubeli acenta: bir sonuç sayfasında iki konteyner
+    hits = {FOUND_CODE: [make_agency(1000), make_agency(1000, acenta_adi="ÖRNEK 1000 TURİZM ŞUBESİ")]}
+    with MockTursabServer(hits=hits) as server:
+        yield server
+
+
+@pytest.fixture(scope='module', params=VARIANTS)
+def backend(request, variant_server):
+    if request.param != 'http' and _chrome_version() is None:
+        pytest.skip("Chrome kurulu değil")
+    with contextlib.redirect_stdout(io.StringIO()):
+        backend = _replay_backend(request.param, variant_server.url)
+        backend.open_site()
+    yield backend
+    with contextlib.redirect_stdout(io.StringIO()):
+        backend.close()
+
+
+def _quiet(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def test_parse_result_page(benchmark):
+    html = (FIXTURES_DIR / "result_found.html").read_text(encoding='utf-8')
+
+    page = benchmark(parse_result_page, html)
+    assert page.status == 'found'
+
+
+def test_search(benchmark, backend):
+    assert benchmark(_quiet, backend.search_agency, FOUND_CODE)
+
+
+def test_search_and_extract_agency_data(benchmark, backend):
+    def search_and_extract():
+        backend.search_agency(FOUND_CODE)
+        return backend.extract_agency_data()
+
+    agencies = benchmark(_quiet, search_and_extract)
+    assert len(agencies) == 2
+
+
+def test_parse_agency_container(benchmark, backend):
+    _quiet(backend.search_agency, FOUND_CODE)
+    containers, parse_container = _agency_containers(backend)
+
+    agencies = benchmark(lambda: [parse_container(container) for container in containers])
+    assert [agency['belge_no'] for agency in agencies] == [FOUND_CODE, FOUND_CODE]
+
+
+@pytest.mark.parametrize('bulk', [False, True], ids=['per-row', 'bulk'])
+def test_save_agencies(benchmark, db_manager, bulk):
+    agencies = [make_agency(code) for code in range(1000, 3000)]
+    rounds = iter(range(1000))
+
+    def changed_batch():
+        # Her turda içerik değişsin ki güncelleme yolu ölçülsün
+        suffix = next(rounds)
+        return ([dict(agency, adres=f"{agency['adres']} / {suffix}") for agency in agencies],), {'bulk': bulk}
+
+    def save(agencies_data, bulk):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return db_manager.save_agencies(agencies_data, bulk=bulk)
+
+    saved = benchmark.pedantic(save, setup=changed_batch, rounds=3)
+    assert saved == len(agencies)
+
+
+def test_duplicate_index_link(benchmark):
+    # Birbirine benzemeyen adlar; her telefonu 10 acenta paylaşır
+    rng = random.Random(5)
+    agencies = [AgencyRecord(**make_agency(code, acenta_adi=''.join(rng.choices(string.ascii_uppercase, k=10)),
+                                           telefon=f"0212 555 {code % 500:04d}"))
+                for code in range(5000)]
+    keys = agency_blocking_keys(agencies)
+
+    def link():
+        index = DuplicateIndex()
+        for agency_id, (core, agency_keys) in enumerate(keys):
+            index.add(agency_id, core, agency_keys)
+        index.link()
+        return index.clusters()
+
+    clusters = benchmark(link)
+    assert len(set(clusters.values())) == 500
@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import make_agency
+from tursab_bot import Agency
+
+
+def _stored(db_manager):
+    with db_manager.session_scope() as session:
+        return {agency.belge_no: (agency.acenta_adi, agency.updated_at, agency.last_seen_at)
+                for agency in session.query(Agency)}
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+def test_save_agencies_inserts_and_updates_changed_rows(db_manager, bulk):
+    assert db_manager.save_agencies([make_agency(code) for code in (1001, 1002)], bulk=bulk) == 2
+    first = _stored(db_manager)
+
+    changed = make_agency(1002, acenta_adi="YENİ AD TURİZM")
+    assert db_manager.save_agencies([make_agency(1001), changed, make_agency(1003)], bulk=bulk) == 3
+    second = _stored(db_manager)
+
+    assert set(second) == {"1001", "1002", "1003"}
+    assert second["1002"][0] == "YENİ AD TURİZM"
+    # Değişmeyen satır güncellenmez, sadece görülme zamanı ilerler
+    assert second["1001"][1] == first["1001"][1]
+    assert second["1001"][2] > first["1001"][2]
+    assert second["1002"][1] > first["1002"][1]
+
+
+def test_bulk_upsert_keeps_last_duplicate_in_batch(db_manager):
+    agencies = [make_agency(1001), make_agency(1001, acenta_adi="ŞUBE TURİZM")]
+
+    assert db_manager.bulk_upsert_agencies(agencies, batch_size=1) == 1
+    assert _stored(db_manager)["1001"][0] == "ŞUBE TURİZM"
+
+
+def test_bulk_save_falls_back_to_row_path_on_unsupported_dialect(db_manager, monkeypatch):
+    monkeypatch.setattr(db_manager, 'supports_bulk_upsert', lambda: False)
+    monkeypatch.setattr(db_manager, 'bulk_upsert_agencies', pytest.fail)
+
+    assert db_manager.save_agencies([make_agency(1001)], bulk=True) == 1
+    assert set(_stored(db_manager)) == {"1001"}
+
+
+def test_bulk_upsert_skips_rows_without_belge_no(db_manager):
+    agencies = [make_agency(1001), make_agency(1002, belge_no=None)]
+
+    assert db_manager.save_agencies(agencies, bulk=True) == 1
+    assert db_manager.save_agencies(agencies, bulk=True) == 1
+    assert set(_stored(db_manager)) == {"1001"}
+    assert db_manager.bulk_upsert_agencies([make_agency(1003, belge_no=None)]) == 0
+
+
+def test_disconnected_manager_returns_before_bulk_path(db_manager, monkeypatch):
+    db_manager.connected = False
+    monkeypatch.setattr(db_manager, 'supports_bulk_upsert', pytest.fail)
+
+    assert db_manager.save_agencies([make_agency(1001)], bulk=True) == 0
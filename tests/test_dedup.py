@@ -0,0 +1,142 @@
+from conftest import make_agency
+from tursab_bot import (
+    Agency, AgencyRecord, DatabaseManager, DuplicateIndex, HttpSearchBackend, WriteBehindWriter,
+    agency_blocking_keys, core_name, dispose_engines, name_similarity,
+)
+
+
+def _clusters(agencies, **kwargs):
+    index = DuplicateIndex(**kwargs)
+    for agency_id, (core, keys) in enumerate(agency_blocking_keys(agencies), start=1):
+        index.add(agency_id, core, keys)
+    index.link()
+    return index.clusters()
+
+
+def test_shared_phone_links_agencies_and_root_is_smallest_id():
+    agencies = [
+        AgencyRecord(belge_no="1", acenta_adi="MAVİ TURİZM", telefon="0212 555 10 10"),
+        AgencyRecord(belge_no="2", acenta_adi="DENİZ SEYAHAT", telefon="+90 212 555 1010"),
+        AgencyRecord(belge_no="3", acenta_adi="ÇINAR TUR", telefon="0312 444 20 20"),
+    ]
+
+    assert _clusters(agencies) == {1: 1, 2: 1, 3: 3}
+
+
+def test_shared_email_links_agencies():
+    agencies = [
+        AgencyRecord(belge_no="1", acenta_adi="MAVİ TURİZM", email="INFO@MAVI.COM"),
+        AgencyRecord(belge_no="2", acenta_adi="MAVİ TUR", email="info@mavi.com"),
+    ]
+
+    assert _clusters(agencies) == {1: 1, 2: 1}
+
+
+def test_near_duplicate_names_are_linked_without_contacts():
+    agencies = [
+        AgencyRecord(belge_no="1", acenta_adi="KARADENİZ YAYLA TURİZM SEYAHAT ACENTASI"),
+        AgencyRecord(belge_no="2", acenta_adi="KARADENIZ YAYLA TURIZM LTD. ŞTİ."),
+        AgencyRecord(belge_no="3", acenta_adi="EGE GÜNEŞ TURİZM"),
+    ]
+
+    clusters = _clusters(agencies)
+    assert clusters[1] == clusters[2] == 1
+    assert clusters[3] == 3
+
+
+def test_free_email_domains_do_not_link_agencies():
+    agencies = [
+        AgencyRecord(belge_no="1", acenta_adi="MAVİ TURİZM", email="mavi@gmail.com"),
+        AgencyRecord(belge_no="2", acenta_adi="ÇINAR TUR", email="cinar@gmail.com"),
+    ]
+
+    assert _clusters(agencies) == {1: 1, 2: 2}
+
+
+def test_crowded_blocks_are_skipped():
+    agencies = [AgencyRecord(belge_no=str(i), acenta_adi=f"ACENTA {i}", telefon="0212 555 10 10")
+                for i in range(5)]
+    index = DuplicateIndex(max_block=3)
+    for agency_id, (core, keys) in enumerate(agency_blocking_keys(agencies), start=1):
+        index.add(agency_id, core, keys)
+    index.link()
+
+    assert index.skipped_blocks == 1
+    assert len(set(index.clusters().values())) == 5
+
+
+def test_core_name_drops_generic_words_before_similarity():
+    assert core_name("Mavi Deniz Turizm Seyahat Acentası") == core_name("MAVİ DENİZ TUR. LTD. ŞTİ.") == "mavi deniz"
+    assert name_similarity(core_name("MAVİ DENİZ TURİZM"), core_name("ÇINAR TUR")) < 0.6
+
+
+def test_shared_domain_needs_similar_names():
+    agencies = [
+        AgencyRecord(belge_no="1", acenta_adi="MAVİ DENİZ TURİZM", email="info@ttnet.com.tr"),
+        AgencyRecord(belge_no="2", acenta_adi="ÇINAR TUR", email="cinar@ttnet.com.tr"),
+        AgencyRecord(belge_no="3", acenta_adi="MAVI DENIZ SEYAHAT LTD. ŞTİ.", email="sube@ttnet.com.tr"),
+    ]
+
+    assert _clusters(agencies) == {1: 1, 2: 2, 3: 1}
+
+
+def test_numbered_names_on_one_domain_are_not_collapsed():
+    # Mock sunucu/benchmark verisi: hepsi ornek.com, adlar sadece numarayla ayrılıyor
+    agencies = [AgencyRecord(belge_no=str(code), acenta_adi=f"ÖRNEK {code} TURİZM SEYAHAT ACENTASI",
+                             email=f"info{code}@ornek.com") for code in range(1000, 1040)]
+
+    assert len(set(_clusters(agencies).values())) == 40
+    assert name_similarity(core_name("ÖRNEK 1000 TURİZM"), core_name("ÖRNEK 1001 TURİZM")) == 0.0
+
+
+def _cluster_ids(db_manager):
+    with db_manager.session_scope() as session:
+        return {agency.belge_no: agency.cluster_id for agency in session.query(Agency)}
+
+
+def test_saves_leave_new_and_changed_rows_pending_until_cluster_pending(db_manager):
+    shared_phone = "0212 555 10 10"
+    db_manager.save_agencies([make_agency(1001, telefon=shared_phone), make_agency(1003)], bulk=True)
+    db_manager.save_agencies([make_agency(1002, telefon=shared_phone)])
+    assert set(_cluster_ids(db_manager).values()) == {None}
+
+    assert db_manager.cluster_pending() == 3
+    clusters = _cluster_ids(db_manager)
+    assert clusters["1001"] == clusters["1002"] != clusters["1003"]
+    assert db_manager.cluster_pending() == 0
+
+    # 1003 telefonunu değiştirip 1001'e bağlanıyor: güncelleme kaydı tekrar bekleyen işe döner
+    db_manager.save_agencies([make_agency(1003, telefon=shared_phone)], bulk=True)
+    assert _cluster_ids(db_manager)["1003"] is None
+    assert db_manager.cluster_pending() == 1
+    assert set(_cluster_ids(db_manager).values()) == {clusters["1001"]}
+
+
+def test_pending_clusters_survive_a_restart(db_manager, tmp_path):
+    db_manager.save_agencies([make_agency(1001), make_agency(1002, email="info1001@ornek1001.com",
+                                                                acenta_adi="ÖRNEK 1001 TURİZM LTD. ŞTİ.")])
+    # Tarama kümelemeden çöktü; yeni süreçteki DatabaseManager bekleyen satırları bulmalı
+    dispose_engines()
+    restarted = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+
+    assert restarted.cluster_pending() == 2
+    assert len(set(_cluster_ids(restarted).values())) == 1
+
+
+def test_backend_saves_are_clustered_as_they_arrive(db_manager):
+    backend = HttpSearchBackend(db_manager=db_manager)
+    backend.save_to_database([make_agency(1001, telefon="0212 555 10 10")])
+    backend.save_to_database([make_agency(1002, telefon="0212 555 10 10")])
+    backend.close()
+
+    clusters = _cluster_ids(db_manager)
+    assert clusters["1001"] == clusters["1002"] is not None
+
+
+def test_write_behind_flushes_cluster_their_rows(db_manager):
+    writer = WriteBehindWriter(db_manager, batch_size=10, flush_interval=0.05)
+    writer.enqueue([make_agency(1001, telefon="0212 555 10 10"), make_agency(1002, telefon="0212 555 10 10")])
+    writer.close()
+
+    clusters = _cluster_ids(db_manager)
+    assert clusters["1001"] == clusters["1002"] is not None
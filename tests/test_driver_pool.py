@@ -0,0 +1,71 @@
+import os
+import types
+
+import pytest
+
+from tursab_bot import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.service = types.SimpleNamespace(process=types.SimpleNamespace(pid=os.getpid()))
+        self.alive = True
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.alive = False
+
+
+class FlakyLauncher:
+    """fail_after başarılı başlatmadan sonraki fail_count başlatma hata verir"""
+
+    def __init__(self, fail_after, fail_count=1):
+        self.launched = 0
+        self.fail_after = fail_after
+        self.fail_count = fail_count
+
+    def __call__(self):
+        self.launched += 1
+        if self.fail_after < self.launched <= self.fail_after + self.fail_count:
+            raise RuntimeError("chromedriver başlatılamadı")
+        return FakeDriver()
+
+
+def test_failed_renew_on_release_keeps_the_slot():
+    launcher = FlakyLauncher(fail_after=1)
+    pool = DriverPool(size=1, max_searches=1, max_rss_mb=0, launcher=launcher)
+
+    pooled = pool.lease(timeout=1)
+    pooled.searches = 1
+    pool.release(pooled)  # yenileme başarısız, yuva boş döner
+
+    pooled = pool.lease(timeout=1)  # boş yuva yeniden başlatılır
+    assert pooled.healthy()
+    assert launcher.launched == 3
+    pool.close()
+
+
+def test_failed_renew_on_lease_keeps_the_slot():
+    launcher = FlakyLauncher(fail_after=1)
+    pool = DriverPool(size=1, max_rss_mb=0, launcher=launcher)
+
+    pooled = pool.lease(timeout=1)
+    pooled.driver.quit()
+    pool.release(pooled)
+    with pytest.raises(RuntimeError):
+        pool.lease(timeout=1)  # bozuk örnek yenilenemedi
+
+    assert pool.lease(timeout=1).healthy()
+    pool.close()
+
+
+def test_lease_times_out_when_the_pool_is_empty():
+    pool = DriverPool(size=1, max_rss_mb=0, launcher=FlakyLauncher(fail_after=10))
+    pool.lease(timeout=1)
+    with pytest.raises(Exception, match="boş Chrome"):
+        pool.lease(timeout=0.2)
+    pool.close()
@@ -0,0 +1,28 @@
+from conftest import make_agency
+from mock_server import MockTursabServer
+from tursab_bot import HttpSearchBackend
+
+
+def test_http_backend_reports_found_empty_and_error():
+    with MockTursabServer(hits={"1001": [make_agency(1001)]}, error_codes={"1002"}) as server:
+        backend = HttpSearchBackend(search_url=server.url)
+        try:
+            backend.open_site()
+            assert backend.search("1001").status == 'found'
+            assert [agency['belge_no'] for agency in backend.extract_agency_data()] == ["1001"]
+            assert backend.search("1000").status == 'empty'
+            assert backend.extract_agency_data() == []
+            assert backend.search("1002").status == 'error'
+        finally:
+            backend.close()
+
+
+def test_http_backend_search_agency_survives_connection_errors():
+    with MockTursabServer() as server:
+        url = server.url
+    # Sunucu kapandı; hata search_agency'den dışarı sızmamalı
+    backend = HttpSearchBackend(search_url=url, timeout=2)
+    assert backend.search_agency("1001") is False
+    assert backend.last_error is not None
+    assert backend.extract_agency_data() == []
+    backend.close()
@@ -0,0 +1,41 @@
+from conftest import FIXTURES_DIR
+from tursab_bot import extract_result_panel, parse_result_page
+
+
+def _fixture(name):
+    return (FIXTURES_DIR / name).read_text(encoding='utf-8')
+
+
+def test_found_page_yields_every_agency_container():
+    page = parse_result_page(_fixture("result_found.html"))
+
+    assert page.status == 'found'
+    assert page.message is None
+    assert [agency['acenta_adi'] for agency in page.agencies] == [
+        "ÖRNEK TURİZM SEYAHAT ACENTASI",
+        "ÖRNEK TURİZM SEYAHAT ACENTASI ŞUBESİ",
+    ]
+    first = page.agencies[0]
+    assert first['belge_no'] == "1001"
+    assert first['email'] == "info@ornek.com"
+    assert first['ilce'] == "ŞİŞLİ"
+    assert first['sehir'] == "İSTANBUL"
+
+
+def test_empty_page_is_not_an_error():
+    page = parse_result_page(_fixture("result_empty.html"))
+
+    assert page.status == 'empty'
+    assert page.agencies == []
+
+
+def test_page_without_result_panel_is_missing():
+    assert parse_result_page("<html><body><form></form></body></html>").status == 'missing'
+
+
+def test_extract_result_panel_keeps_only_visible_panels():
+    panel = extract_result_panel(_fixture("result_found.html"))
+
+    assert panel.startswith('<div id="ContentPlaceHolder1_ResultPanel">')
+    assert "__VIEWSTATE" not in panel
+    assert extract_result_panel("<html><body></body></html>") is None
@@ -0,0 +1,26 @@
+from tursab_bot import AGENCY_FIELDS, AgencyRecord, as_agency_record
+
+from conftest import make_agency
+
+
+def test_record_reads_like_the_old_dict():
+    data = make_agency(1001)
+    record = AgencyRecord.from_dict(data)
+
+    assert dict(record) == data
+    assert record['telefon'] == data['telefon']
+    assert record.get('email') == data['email']
+    assert record.get('content_hash', 'yok') == 'yok'
+    assert list(record.keys()) == list(AGENCY_FIELDS)
+
+
+def test_record_item_assignment():
+    record = AgencyRecord(belge_no="1001")
+    record['sehir'] = "ANKARA"
+    assert record.sehir == "ANKARA"
+
+
+def test_as_agency_record_keeps_records():
+    record = AgencyRecord(belge_no="1001")
+    assert as_agency_record(record) is record
+    assert as_agency_record({'belge_no': "1001"}) == record
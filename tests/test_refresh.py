@@ -0,0 +1,86 @@
+import json
+
+from conftest import make_agency
+from mock_server import MockTursabServer
+from tursab_bot import (
+    Agency, ChangeLog, CircuitBreaker, HttpSearchBackend, PageResult, RefreshScheduler, ScanStateStore,
+)
+
+
+def test_refresh_targets_keep_leading_zeros_and_skip_non_numeric(db_manager):
+    db_manager.save_agencies([make_agency(1001, belge_no="01001"), make_agency(1002, belge_no="A-12")])
+
+    assert db_manager.get_refresh_targets() == ["01001"]
+
+
+class BlankOnceBackend(HttpSearchBackend):
+    """Verilen kodlarda ilk aramada boş postback döndüren backend"""
+
+    def __init__(self, blank_codes, **kwargs):
+        super().__init__(**kwargs)
+        self.blank_codes = blank_codes
+        self.searched_codes = []
+
+    def search(self, code):
+        self.searched_codes.append(code)
+        if code in self.blank_codes:
+            self.blank_codes.discard(code)
+            self.last_result = PageResult('empty', [], "Sonuç paneli görünmüyor")
+            return self.last_result
+        return super().search(code)
+
+
+def _seed(db_manager, hits):
+    """Acentaları mock sunucudan parse edildikleri haliyle kaydet (yenilemede sahte değişiklik olmasın)"""
+    with MockTursabServer(hits=hits) as server:
+        backend = HttpSearchBackend(search_url=server.url)
+        for code in hits:
+            db_manager.save_agencies(backend.search(code).agencies)
+        backend.close()
+
+
+def _refresh(db_manager, server, tmp_path, blank_codes=(), **kwargs):
+    backends = []
+
+    def factory():
+        backends.append(BlankOnceBackend(set(blank_codes), search_url=server.url, db_manager=db_manager))
+        return backends[-1]
+
+    changelog = ChangeLog(tmp_path / "changes.jsonl")
+    state_store = ScanStateStore(tmp_path / "state.tsv")
+    scheduler = RefreshScheduler(factory, db_manager, db_manager.get_refresh_targets(), changelog, rate=0,
+                                 state_store=state_store, breaker=CircuitBreaker(threshold=0), **kwargs)
+    stats = scheduler.run()
+    changelog.close()
+    state_store.close()
+    with open(tmp_path / "changes.jsonl", encoding='utf-8') as f:
+        changes = [json.loads(line) for line in f]
+    return stats, changes, [code for backend in backends for code in backend.searched_codes]
+
+
+def test_refresh_searches_stored_string_belge_numbers(db_manager, tmp_path):
+    stored = {"01001": [make_agency(1001, belge_no="01001")], "1002": [make_agency(1002)]}
+    _seed(db_manager, stored)
+    changed = dict(stored, **{"1002": [make_agency(1002, acenta_adi="YENİ AD TURİZM")]})
+    with MockTursabServer(hits=changed) as server:
+        stats, changes, searched = _refresh(db_manager, server, tmp_path)
+
+    assert sorted(searched) == ["01001", "1002"]
+    assert stats.counts == {'found': 2, 'empty': 0, 'error': 0}
+    assert [(change['type'], change['belge_no']) for change in changes] == [('modified', "1002")]
+    with db_manager.session_scope() as session:
+        assert session.query(Agency.acenta_adi).filter_by(belge_no="1002").scalar() == "YENİ AD TURİZM"
+        # Baştaki sıfır atılıp "1001" diye ayrı bir kayıt oluşmamalı
+        assert session.query(Agency).filter_by(belge_no="1001").count() == 0
+
+
+def test_single_blank_response_is_not_logged_as_disappeared(db_manager, tmp_path):
+    stored = {"1001": [make_agency(1001)], "1002": [make_agency(1002)]}
+    _seed(db_manager, stored)
+    # 1001 bir kez boş dönüyor ama hâlâ var; 1002 gerçekten kayboldu
+    with MockTursabServer(hits={"1001": stored["1001"]}) as server:
+        stats, changes, searched = _refresh(db_manager, server, tmp_path, blank_codes={"1001"})
+
+    assert sorted(searched) == ["1001", "1001", "1002", "1002"]
+    assert stats.counts == {'found': 1, 'empty': 1, 'error': 0}
+    assert [(change['type'], change['belge_no']) for change in changes] == [('disappeared', "1002")]
@@ -0,0 +1,139 @@
+import threading
+
+from conftest import make_agency
+from mock_server import MockTursabServer
+from tursab_bot import CircuitBreaker, HttpSearchBackend, RetryPolicy, RetryRule, ScanScheduler, ScanStateStore
+
+# Testlerde tekrar denemeler beklemeden yapılsın
+NO_BACKOFF = RetryPolicy({'site_error': RetryRule(0.0, 0.0, 4, 'reload')})
+
+
+def test_retry_policy_uses_rule_of_error_class():
+    policy = RetryPolicy()
+
+    assert policy.rule('site_error').recovery == 'reload'
+    assert policy.rule('bilinmeyen') == policy.rule('exception')
+    assert policy.should_retry('site_error', 3)
+    assert not policy.should_retry('site_error', 4)
+
+
+def test_retry_policy_max_attempts_overrides_every_rule():
+    policy = RetryPolicy(max_attempts=1)
+
+    assert all(rule.max_attempts == 1 for rule in policy.rules.values())
+
+
+def test_retry_delay_grows_exponentially_with_jitter_and_cap():
+    policy = RetryPolicy({'timeout': RetryRule(2.0, 10.0, 5, 'reload')})
+
+    for attempt, full in ((1, 2.0), (2, 4.0), (3, 8.0), (4, 10.0), (5, 10.0)):
+        delay = policy.delay('timeout', attempt)
+        assert full / 2 <= delay <= full
+
+
+def test_circuit_breaker_trips_and_closes_after_successful_probe():
+    breaker = CircuitBreaker(threshold=0.5, window=4, min_samples=4, cooldown=0.05)
+    for error_class in ('site_error', None, 'timeout', None):
+        breaker.record(error_class)
+    assert breaker.state == 'open'
+    assert breaker.trips == 1
+
+    # Bekleme dolunca tek worker deneme isteği yapar
+    assert breaker.wait(threading.Event())
+    assert breaker.state == 'half_open'
+    breaker.record(None)
+    assert breaker.state == 'closed'
+
+
+def test_circuit_breaker_doubles_cooldown_when_probe_fails():
+    breaker = CircuitBreaker(threshold=0.5, window=2, min_samples=2, cooldown=0.05, max_cooldown=0.15)
+    breaker.record('network')
+    breaker.record('network')
+    assert breaker.wait(threading.Event())
+    breaker.record('network')
+
+    assert breaker.state == 'open'
+    assert breaker.trips == 2
+    assert breaker.cooldown == 0.15
+
+
+def test_circuit_breaker_ignores_non_site_errors_and_can_be_disabled():
+    breaker = CircuitBreaker(threshold=0.5, window=2, min_samples=2)
+    breaker.record('driver_dead')
+    breaker.record('exception')
+    assert breaker.state == 'closed'
+
+    disabled = CircuitBreaker(threshold=0, window=2, min_samples=2)
+    disabled.record('site_error')
+    disabled.record('site_error')
+    assert disabled.state == 'closed'
+
+
+def test_open_circuit_wait_returns_false_when_stopped():
+    breaker = CircuitBreaker(threshold=1.0, window=1, min_samples=1, cooldown=60)
+    breaker.record('site_error')
+    stop_event = threading.Event()
+    stop_event.set()
+
+    assert breaker.wait(stop_event) is False
+
+
+def test_scheduler_retries_flaky_codes(tmp_path):
+    hits = {str(code): [make_agency(code)] for code in (1001, 1004)}
+    with MockTursabServer(hits=hits, flaky_codes={"1001": 2, "1002": 1}) as server:
+        state_store = ScanStateStore(tmp_path / "state.tsv")
+        scheduler = ScanScheduler(lambda: HttpSearchBackend(search_url=server.url), range(1000, 1006), rate=0,
+                                  state_store=state_store, retry_policy=NO_BACKOFF,
+                                  breaker=CircuitBreaker(threshold=0))
+        stats = scheduler.run()
+        state_store.close()
+
+    assert stats.counts == {'found': 2, 'empty': 4, 'error': 0}
+    assert stats.retries['site_error'] == 3
+    assert state_store.status(1001) == 'found'
+    assert state_store.pending(range(1000, 1006)) == []
+
+
+def test_scheduler_checkpoints_codes_that_exhaust_retries_as_error(tmp_path):
+    with MockTursabServer(error_codes={"1001"}) as server:
+        state_store = ScanStateStore(tmp_path / "state.tsv")
+        scheduler = ScanScheduler(lambda: HttpSearchBackend(search_url=server.url), range(1000, 1003), rate=0,
+                                  state_store=state_store, retry_policy=NO_BACKOFF,
+                                  breaker=CircuitBreaker(threshold=0))
+        stats = scheduler.run()
+        state_store.close()
+
+    assert stats.counts['error'] == 1
+    assert state_store.status(1001) == 'error'
+    # Hatalı kodlar resume'da tekrar taranır
+    assert state_store.pending(range(1000, 1003)) == [1001]
+
+
+class CrashingBackend(HttpSearchBackend):
+    """Verilen kodlarda ilk denemede sonuç temizlerken çöken backend (worker yeniden başlar)"""
+
+    def __init__(self, crash_codes, **kwargs):
+        super().__init__(**kwargs)
+        self.crash_codes = crash_codes
+
+    def search_agency(self, code):
+        self.last_code = code
+        return super().search_agency(code)
+
+    def clear_results(self):
+        if self.last_code in self.crash_codes:
+            self.crash_codes.discard(self.last_code)
+            raise RuntimeError(f"{self.last_code} sonrası çöktü")
+
+
+def test_worker_restart_budget_resets_after_successful_codes(mock_server):
+    # Çöküşler arasında başarılı kodlar var; toplam çöküş max_restarts'ı geçse de worker durmamalı
+    crash_codes = {"1001", "1004", "1007", "1010"}
+    scheduler = ScanScheduler(lambda: CrashingBackend(crash_codes, search_url=mock_server.url), range(1000, 1012),
+                              rate=0, max_restarts=1,
+                              retry_policy=RetryPolicy({'exception': RetryRule(0.0, 0.0, 2, 'restart')}),
+                              breaker=CircuitBreaker(threshold=0))
+    stats = scheduler.run()
+
+    assert stats.restarts == 4
+    assert stats.counts == {'found': 4, 'empty': 8, 'error': 0}
@@ -0,0 +1,14 @@
+from tursab_bot import CircuitBreaker, HttpSearchBackend, ScanScheduler, ScanStateStore
+
+
+def test_scheduler_scans_every_code_against_mock_server(mock_server, tmp_path):
+    state_store = ScanStateStore(tmp_path / "state.tsv")
+    scheduler = ScanScheduler(lambda: HttpSearchBackend(search_url=mock_server.url), range(1000, 1030),
+                              workers=3, chunk_size=5, rate=0, state_store=state_store,
+                              breaker=CircuitBreaker(threshold=0))
+    stats = scheduler.run()
+    state_store.close()
+
+    assert stats.counts == {'found': 10, 'empty': 20, 'error': 0}
+    assert state_store.codes_with_status('found') == set(range(1000, 1030, 3))
+    assert state_store.pending(range(1000, 1030)) == []
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+from conftest import ROOT
+
+HEAVY_MODULES = ('sqlalchemy', 'selenium', 'bs4', 'requests', 'pandas')
+
+
+def _loaded_after(code):
+    script = f"import sys\n{code}\nprint(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    return subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True,
+                          check=True).stdout.split()
+
+
+def test_import_does_not_load_heavy_packages():
+    assert _loaded_after("import tursab_bot") == []
+
+
+def test_model_access_loads_sqlalchemy_on_demand():
+    assert _loaded_after("from tursab_bot import Agency\nassert Agency.__tablename__ == 'agencies'") == ['sqlalchemy']
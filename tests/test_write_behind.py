@@ -0,0 +1,85 @@
+import time
+
+from tursab_bot import (
+    Agency, AgencyRecord, CircuitBreaker, HttpSearchBackend, ScanScheduler, ScanStateStore, WriteBehindWriter,
+)
+
+
+def _stored_belge_numbers(db_manager):
+    with db_manager.session_scope() as session:
+        return {belge_no for (belge_no,) in session.query(Agency.belge_no)}
+
+
+def test_enqueue_accepts_records_and_dicts(db_manager):
+    writer = WriteBehindWriter(db_manager, batch_size=10, flush_interval=0.05)
+    writer.enqueue([AgencyRecord(belge_no="1001", acenta_adi="A"), {'belge_no': "1002", 'acenta_adi': "B"}])
+    writer.close()
+
+    assert writer.metrics()['rows_written'] == 2
+    assert _stored_belge_numbers(db_manager) == {"1001", "1002"}
+
+
+def test_scan_with_write_behind_saves_every_found_agency(db_manager, mock_server, tmp_path):
+    writer = WriteBehindWriter(db_manager, batch_size=5, flush_interval=0.05)
+    state_store = ScanStateStore(tmp_path / "state.tsv")
+    scheduler = ScanScheduler(
+        lambda: HttpSearchBackend(search_url=mock_server.url, db_manager=db_manager, writer=writer),
+        range(1000, 1030), workers=2, chunk_size=10, rate=0, state_store=state_store,
+        breaker=CircuitBreaker(threshold=0),
+    )
+    stats = scheduler.run()
+    writer.close()
+    state_store.close()
+
+    assert stats.counts['found'] == 10
+    assert stats.counts['empty'] == 20
+    assert stats.restarts == 0
+    assert writer.metrics()['failed_rows'] == 0
+    assert _stored_belge_numbers(db_manager) == {code for code in mock_server.hits if int(code) < 1030}
+
+
+
+def test_found_codes_are_checkpointed_only_after_rows_are_written(db_manager, mock_server, tmp_path, monkeypatch):
+    # Yazılamayan acentaların kodları resume'da tekrar taranmak üzere checkpoint'siz kalmalı
+    def failing_save(agencies, **kwargs):
+        raise RuntimeError("veritabanı yok")
+
+    monkeypatch.setattr(db_manager, 'save_agencies', failing_save)
+    writer = WriteBehindWriter(db_manager, batch_size=5, flush_interval=0.05)
+    state_store = ScanStateStore(tmp_path / "state.tsv")
+    scheduler = ScanScheduler(
+        lambda: HttpSearchBackend(search_url=mock_server.url, db_manager=db_manager, writer=writer),
+        range(1000, 1012), rate=0, state_store=state_store, breaker=CircuitBreaker(threshold=0),
+    )
+    stats = scheduler.run()
+    writer.close()
+    state_store.close()
+
+    assert stats.counts['found'] == 4
+    assert writer.metrics()['failed_rows'] == 4
+    assert state_store.codes_with_status('found') == set()
+    assert state_store.pending(range(1000, 1012)) == [1000, 1003, 1006, 1009]
+
+
+def test_unfinished_group_is_flushed_on_interval(db_manager):
+    # Üretici grubun ilk kaydını koyduktan sonra hata aldı; kayıt close() beklemeden yazılmalı
+    writer = WriteBehindWriter(db_manager, batch_size=10, flush_interval=0.05)
+    writer.queue.put((AgencyRecord(belge_no="1001", acenta_adi="A"), None, False))
+    deadline = time.monotonic() + 5
+    while writer.metrics()['rows_written'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert _stored_belge_numbers(db_manager) == {"1001"}
+    writer.close()
+
+
+def test_group_callback_is_skipped_when_an_earlier_part_failed(db_manager, monkeypatch):
+    saves = iter([0, 1])
+    monkeypatch.setattr(db_manager, 'save_agencies', lambda agencies, **kwargs: next(saves))
+    writer = WriteBehindWriter(db_manager, batch_size=1, flush_interval=0.05)
+    saved = []
+    writer.enqueue([AgencyRecord(belge_no="1001"), AgencyRecord(belge_no="1002")], on_saved=lambda: saved.append(1))
+    writer.close()
+
+    assert writer.metrics()['failed_rows'] == 1
+    assert saved == []